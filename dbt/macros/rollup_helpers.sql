@@ -0,0 +1,29 @@
+{#
+  Shared metric columns for the rollup marts in models/marts/rollups.
+#}
+
+{% macro rollup_movie_metrics() -%}
+    count(distinct movie_id) as movie_count,
+
+    -- budget (movies with unknown budget are excluded)
+    count(budget) as budget_movie_count,
+    sum(budget) as total_budget,
+    round(avg(budget), 2) as avg_budget,
+    quantile_cont(budget, 0.5) as median_budget,
+    quantile_cont(budget, 0.9) as p90_budget,
+
+    -- revenue (movies with unknown revenue are excluded)
+    count(revenue) as revenue_movie_count,
+    sum(revenue) as total_revenue,
+    round(avg(revenue), 2) as avg_revenue,
+    quantile_cont(revenue, 0.5) as median_revenue,
+    quantile_cont(revenue, 0.9) as p90_revenue,
+
+    -- votes
+    sum(vote_count) as total_vote_count,
+    round(avg(vote_average), 3) as avg_vote_average,
+    quantile_cont(vote_average, 0.5) as median_vote_average,
+
+    -- auditing
+    max(ingested_at) as last_ingested_at
+{%- endmacro %}
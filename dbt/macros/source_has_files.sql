@@ -0,0 +1,21 @@
+{#
+  True if a parquet-backed source currently has at least one file at its
+  external_location. Lets optional sources (e.g. the person cache) fall back
+  to an empty relation instead of failing with "No files found".
+  Always true at parse time so the source() dependency is still recorded.
+#}
+
+{% macro source_has_files(source_name, table_name) -%}
+  {%- if not execute -%}
+    {{ return(true) }}
+  {%- endif -%}
+
+  {%- for node in graph.sources.values() -%}
+    {%- if node.source_name == source_name and node.name == table_name -%}
+      {%- set location = node.meta.external_location -%}
+      {{ return(run_query("select count(*) from glob('" ~ location ~ "')").columns[0].values()[0] > 0) }}
+    {%- endif -%}
+  {%- endfor -%}
+
+  {{ exceptions.raise_compiler_error("Unknown source " ~ source_name ~ "." ~ table_name) }}
+{%- endmacro %}
@@ -0,0 +1,29 @@
+-- int_tmdb_movies_by_year
+
+with src as (
+    select
+        movie_id,
+        release_date,
+        budget,
+        revenue,
+        popularity,
+        vote_average,
+        vote_count,
+        ingested_at
+    from {{ ref('stg_tmdb__movies') }}
+    where release_date is not null
+)
+
+select
+    movie_id,
+    year(release_date) as release_year,
+
+    -- TMDB uses 0 for unknown budget/revenue, so treat it as missing
+    nullif(budget, 0) as budget,
+    nullif(revenue, 0) as revenue,
+    popularity,
+    vote_average,
+    vote_count,
+
+    ingested_at
+from src
@@ -41,6 +41,33 @@ deduped as (
                 popularity desc,
                 name asc
         ) = 1
+),
+
+person_details as (
+    select
+        person_id,
+        birthday,
+        deathday,
+        place_of_birth,
+        biography,
+        popularity
+    from {{ ref('stg_tmdb__people') }}
 )
 
-select * from deduped
\ No newline at end of file
+select
+    d.person_id,
+    d.name,
+    d.original_name,
+    d.gender,
+    d.known_for_department,
+
+    -- person details endpoint is the source of truth; fall back to credit averages
+    coalesce(round(p.popularity, 3), d.popularity) as popularity,
+
+    p.birthday,
+    p.deathday,
+    p.place_of_birth,
+    p.biography
+from deduped d
+left join person_details p
+    on d.person_id = p.person_id
@@ -0,0 +1,29 @@
+-- agg_companies_yearly.sql
+
+with movies as (
+    select
+        movie_id,
+        release_year,
+        budget,
+        revenue,
+        vote_average,
+        vote_count,
+        ingested_at
+    from {{ ref('int_tmdb_movies_by_year') }}
+),
+
+movies_companies as (
+    select
+        pc.company_id,
+        m.*
+    from movies m
+    join {{ ref('int_tmdb_production_companies_unnested') }} pc
+        on m.movie_id = pc.movie_id
+)
+
+select
+    company_id,
+    release_year,
+    {{ rollup_movie_metrics() }}
+from movies_companies
+group by company_id, release_year
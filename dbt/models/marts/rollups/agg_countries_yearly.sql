@@ -0,0 +1,29 @@
+-- agg_countries_yearly.sql
+
+with movies as (
+    select
+        movie_id,
+        release_year,
+        budget,
+        revenue,
+        vote_average,
+        vote_count,
+        ingested_at
+    from {{ ref('int_tmdb_movies_by_year') }}
+),
+
+movies_countries as (
+    select
+        c.origin_country_code as country_code,
+        m.*
+    from movies m
+    join {{ ref('int_tmdb_movies_origin_countries') }} c
+        on m.movie_id = c.movie_id
+)
+
+select
+    country_code,
+    release_year,
+    {{ rollup_movie_metrics() }}
+from movies_countries
+group by country_code, release_year
@@ -0,0 +1,65 @@
+-- agg_departments_yearly.sql
+
+with movies as (
+    select
+        movie_id,
+        release_year,
+        budget,
+        revenue,
+        vote_average,
+        vote_count,
+        ingested_at
+    from {{ ref('int_tmdb_movies_by_year') }}
+),
+
+credits as (
+    select
+        c.movie_id,
+        c.person_id,
+        -- cast credits have no department on TMDB
+        coalesce(c.department, 'Acting') as department,
+        m.release_year
+    from {{ ref('int_tmdb_cast_crew_combined') }} c
+    join movies m
+        on c.movie_id = m.movie_id
+),
+
+credit_counts as (
+    select
+        department,
+        release_year,
+        count(*) as credit_count,
+        count(distinct person_id) as person_count
+    from credits
+    group by department, release_year
+),
+
+-- one row per movie per department so movie metrics aren't counted once per credit
+movies_departments as (
+    select
+        d.department,
+        m.*
+    from movies m
+    join (select distinct department, movie_id from credits) d
+        on m.movie_id = d.movie_id
+),
+
+movie_metrics as (
+    select
+        department,
+        release_year,
+        {{ rollup_movie_metrics() }}
+    from movies_departments
+    group by department, release_year
+)
+
+select
+    mm.department,
+    mm.release_year,
+    cc.credit_count,
+    cc.person_count,
+    mm.* exclude (department, release_year)
+from movie_metrics mm
+join credit_counts cc
+    on mm.department = cc.department
+    and mm.release_year = cc.release_year
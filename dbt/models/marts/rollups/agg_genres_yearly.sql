@@ -0,0 +1,29 @@
+-- agg_genres_yearly.sql
+
+with movies as (
+    select
+        movie_id,
+        release_year,
+        budget,
+        revenue,
+        vote_average,
+        vote_count,
+        ingested_at
+    from {{ ref('int_tmdb_movies_by_year') }}
+),
+
+movies_genres as (
+    select
+        g.genre_id,
+        m.*
+    from movies m
+    join {{ ref('int_tmdb_movies_genres') }} g
+        on m.movie_id = g.movie_id
+)
+
+select
+    genre_id,
+    release_year,
+    {{ rollup_movie_metrics() }}
+from movies_genres
+group by genre_id, release_year
@@ -0,0 +1,87 @@
+-- stg_tmdb__people.sql
+
+with src as (
+{% if source_has_files('tmdb', 'person_details') %}
+    select
+        person_id,
+        payload_json,
+        ingested_at
+    from {{ source('tmdb', 'person_details')}}
+{% else %}
+    -- Person cache not fetched yet: empty, typed stand-in so dim_people falls back to credit data
+    select
+        null::bigint as person_id,
+        null::struct(
+            imdb_id varchar,
+            name varchar,
+            also_known_as varchar[],
+            gender bigint,
+            known_for_department varchar,
+            place_of_birth varchar,
+            biography varchar,
+            birthday varchar,
+            deathday varchar,
+            popularity double,
+            adult boolean,
+            profile_path varchar,
+            homepage varchar
+        ) as payload_json,
+        null::timestamptz as ingested_at
+    where false
+{% endif %}
+),
+
+-- Batch files may hold more than one fetch per person.
+-- Rows with a null payload are people TMDB returned 404 for, dropped after dedupe
+deduped as (
+    select
+        person_id,
+        payload_json as p,
+        ingested_at
+    from src
+    QUALIFY row_number() over (
+        partition by person_id
+        order by ingested_at desc
+    ) = 1
+)
+
+select
+    -- Primary key
+    person_id,
+
+    -- Foreign keys
+    nullif(p.imdb_id, '') AS imdb_id,
+
+    -- Core identifiers
+    p.name,
+    p.also_known_as,
+
+    -- Important dimensions
+    case
+        when p.gender = 1 then 'Female'
+        when p.gender = 2 then 'Male'
+        when p.gender = 3 then 'Non-binary'
+        else 'Not specified'
+    end as gender,
+    nullif(p.known_for_department, '') AS known_for_department,
+    nullif(p.place_of_birth, '') AS place_of_birth,
+
+    -- Biographical info
+    nullif(p.biography, '') AS biography,
+    nullif(p.birthday, '')::date AS birthday,
+    nullif(p.deathday, '')::date AS deathday,
+
+    -- Key metrics
+    p.popularity::double AS popularity,
+
+    -- Boolean flags
+    p.adult::boolean AS adult,
+
+    -- Media paths
+    p.profile_path,
+    nullif(p.homepage, '') AS homepage,
+
+    -- Auditing
+    ingested_at
+from deduped
+where p is not null
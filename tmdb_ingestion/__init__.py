@@ -10,11 +10,23 @@ Layout:
 
 - jobs/
     discover_movies.py
-    fetch_details_and_credits.py
+    fetch_movie_details.py
+    fetch_person_details.py
     update_seeds.py
 
 - ingest_tmdb.py
     Optional orchestrator that can call multiple jobs in sequence.
+
+- cli.py / __main__.py
+    CLI entry point: `python -m tmdb_ingestion <command>`.
+
+- bench_import.py
+    Import-time benchmark for the CLI startup path.
+
+Lazy imports: third-party dependencies (pandas, pyarrow, aiohttp, aiolimiter,
+tqdm, tenacity, requests, yaml, dotenv) are imported inside the functions
+that use them, never at module level. That keeps `import tmdb_ingestion`,
+`--help` and small jobs fast. bench_import.py fails if one leaks back in.
 """
 
 from .utils import (
@@ -0,0 +1,3 @@
+from tmdb_ingestion.cli import main
+
+main()
@@ -0,0 +1,105 @@
+"""
+Import-time benchmark for the ingestion CLI (python -m tmdb_ingestion).
+
+Runs each startup path in a fresh interpreter and reports the median wall
+time, then checks that importing the package and job modules does not pull
+in any heavy dependencies. Exits non-zero if one leaks in.
+
+Usage:
+    python -m tmdb_ingestion.bench_import [--runs 10]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from typing import List
+
+
+HEAVY_MODULES = [
+    "aiohttp",
+    "aiolimiter",
+    "pandas",
+    "pyarrow",
+    "requests",
+    "tenacity",
+    "tqdm",
+    "yaml",
+    "dotenv",
+]
+
+# label -> interpreter args
+SCENARIOS = {
+    "python (baseline)": ["-c", "pass"],
+    "import tmdb_ingestion": ["-c", "import tmdb_ingestion"],
+    "cli --help": ["-m", "tmdb_ingestion", "--help"],
+    "cli seeds --help": ["-m", "tmdb_ingestion", "seeds", "--help"],
+}
+
+LAZY_CHECK = """
+import sys
+import tmdb_ingestion
+import tmdb_ingestion.cli
+import tmdb_ingestion.ingest_tmdb
+import tmdb_ingestion.jobs.discover_movies
+import tmdb_ingestion.jobs.fetch_movie_details
+import tmdb_ingestion.jobs.fetch_person_details
+import tmdb_ingestion.jobs.update_seeds
+heavy = {heavy!r}
+print(",".join(m for m in heavy if m in sys.modules))
+"""
+
+
+def _time_run(args: List[str], runs: int) -> float:
+    """
+    Median wall time (ms) of running the interpreter with args.
+    """
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, *args],
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def _leaked_modules() -> List[str]:
+    """
+    Heavy modules loaded by importing the package and every job module.
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", LAZY_CHECK.format(heavy=HEAVY_MODULES)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return [m for m in result.stdout.strip().split(",") if m]
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark ingestion CLI startup time.")
+    parser.add_argument("--runs", type=int, default=10, help="Runs per scenario (default: 10)")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = _parse_args()
+
+    print(f"Median startup time over {args.runs} runs")
+    print("-" * 45)
+    for label, interpreter_args in SCENARIOS.items():
+        print(f"{label:<30} {_time_run(interpreter_args, args.runs):8.1f} ms")
+
+    leaked = _leaked_modules()
+    print("-" * 45)
+    if leaked:
+        print(f"FAIL: heavy modules imported at load time: {', '.join(leaked)}")
+        sys.exit(1)
+    print("OK: no heavy modules imported at load time")
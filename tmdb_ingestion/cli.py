@@ -0,0 +1,125 @@
+"""
+CLI for the TMDB ingestion jobs, run as `python -m tmdb_ingestion`.
+
+Usage:
+    python -m tmdb_ingestion <command> [overrides]
+
+Commands:
+    discover   Discover movies by year range
+    details    Fetch details and credits for discovered movies
+    people     Fetch person details for new/stale people in the credits
+    seeds      Update seed CSVs (genres, countries, languages)
+    full       Run discover + details in sequence (people runs separately)
+
+Jobs (and their pandas/pyarrow/aiohttp imports) are only loaded for the
+command that runs, so --help and small commands start quickly.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+from typing import Dict, Any, List, Optional
+
+from tmdb_ingestion.utils import load_config
+
+
+# command -> (module, entrypoint, help)
+COMMANDS = {
+    "discover": (
+        "tmdb_ingestion.jobs.discover_movies",
+        "run_discover_movies",
+        "Discover TMDB movies for a year range.",
+    ),
+    "details": (
+        "tmdb_ingestion.jobs.fetch_movie_details",
+        "run_movie_details",
+        "Fetch TMDB movie details and credits for discovered movies.",
+    ),
+    "people": (
+        "tmdb_ingestion.jobs.fetch_person_details",
+        "run_person_details",
+        "Fetch TMDB person details for all people in the credits data.",
+    ),
+    "seeds": (
+        "tmdb_ingestion.jobs.update_seeds",
+        "run_update_seeds",
+        "Update TMDB seed CSVs (genres, countries, languages).",
+    ),
+    "full": (
+        "tmdb_ingestion.ingest_tmdb",
+        "run_full_ingestion",
+        "Run full TMDB ingestion pipeline (discover + details).",
+    ),
+}
+
+
+def apply_overrides(cfg: Dict[str, Any], args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Apply shared CLI overrides on top of config.yml values.
+    """
+    ingestion_overrides = {
+        "start_year": args.start_year,
+        "end_year": args.end_year,
+        "batch_size": args.batch_size,
+        "vote_count_gte": args.vote_count_gte,
+        "person_cache_ttl_days": args.cache_ttl_days,
+    }
+    for key, value in ingestion_overrides.items():
+        if value is not None:
+            cfg["ingestion"][key] = value
+
+    if args.data_dir is not None:
+        cfg["paths"]["data_dir"] = args.data_dir
+    if args.seeds_dir is not None:
+        cfg["paths"]["seeds_dir"] = args.seeds_dir
+
+    return cfg
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    CLI parser with one subcommand per job and shared config overrides.
+    """
+    overrides = argparse.ArgumentParser(add_help=False)
+    group = overrides.add_argument_group("config overrides")
+    group.add_argument("--start-year", type=int, help="Override start year (inclusive)")
+    group.add_argument("--end-year", type=int, help="Override end year (inclusive)")
+    group.add_argument("--vote-count-gte", type=int, help="Override minimum vote count filter")
+    group.add_argument("--batch-size", type=int, help="Override batch size for fetching")
+    group.add_argument(
+        "--cache-ttl-days",
+        type=int,
+        help="Override the minimum days a cached person stays fresh",
+    )
+    group.add_argument("--data-dir", help="Override data directory")
+    group.add_argument("--seeds-dir", help="Override dbt seeds directory")
+
+    parser = argparse.ArgumentParser(
+        prog="python -m tmdb_ingestion",
+        description="Run TMDB ingestion jobs.",
+    )
+    subparsers = parser.add_subparsers(dest="command", metavar="command", required=True)
+    for name, (_, _, help_text) in COMMANDS.items():
+        subparsers.add_parser(
+            name,
+            parents=[overrides],
+            help=help_text,
+            description=help_text,
+        )
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = _build_parser().parse_args(argv)
+
+    module_name, entrypoint, _ = COMMANDS[args.command]
+    run_job = getattr(importlib.import_module(module_name), entrypoint)
+
+    cfg = apply_overrides(load_config(), args)
+    run_job(cfg)
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,9 @@ def run_full_ingestion(cfg: Dict[str, Any]) -> None:
     Orchestrates the full TMDB ingestion pipeline:
     1. Discover movies by year range
     2. Fetch details and credits for discovered movies
+
+    Person details are left out on purpose: the first run fetches every
+    person in the credits and takes hours. Run the `people` job separately.
     """
     start = time.time()
     
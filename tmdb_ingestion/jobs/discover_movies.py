@@ -5,11 +5,6 @@ import asyncio
 from pathlib import Path
 from typing import Dict, Any, List
 
-import aiohttp
-import pandas as pd
-from aiolimiter import AsyncLimiter
-from tqdm.asyncio import tqdm_asyncio
-
 from tmdb_ingestion.utils import (
     load_config,
     get_api_key,
@@ -69,6 +64,11 @@ async def _discover_movies_for_range(
     - Writes one Parquet file per year
     - Uses date-based filtering and sorting to avoid pagination quirks
     """
+    import aiohttp
+    import pandas as pd
+    from aiolimiter import AsyncLimiter
+    from tqdm.asyncio import tqdm_asyncio
+
     base_url = api_cfg["discover_url"]  # e.g. https://api.themoviedb.org/3/discover/movie
 
     limiter = AsyncLimiter(conc_cfg["max_rate"], conc_cfg["time_period"])
@@ -4,14 +4,7 @@ import argparse
 import asyncio
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any, List
-
-import aiohttp
-import pandas as pd
-import pyarrow as pa
-import pyarrow.parquet as pq
-from aiolimiter import AsyncLimiter
-from tqdm.asyncio import tqdm_asyncio
+from typing import TYPE_CHECKING, Dict, Any, List
 
 from tmdb_ingestion.utils import (
     load_config,
@@ -20,6 +13,10 @@ from tmdb_ingestion.utils import (
     fetch_api_data,
 )
 
+if TYPE_CHECKING:
+    import aiohttp
+    from aiolimiter import AsyncLimiter
+
 
 def run_movie_details(cfg: Dict[str, Any]) -> None:
     """
@@ -76,6 +73,13 @@ async def _fetch_details_and_credits(
     - Fetches in batches with streaming writes
     - Writes to single Parquet file with append mode
     """
+    import aiohttp
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    from aiolimiter import AsyncLimiter
+    from tqdm.asyncio import tqdm_asyncio
+
     base_url = api_cfg["details_url"]  # e.g. https://api.themoviedb.org/3/movie/
 
     params = {
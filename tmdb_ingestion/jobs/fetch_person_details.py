@@ -0,0 +1,342 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
+
+from tmdb_ingestion.utils import (
+    load_config,
+    get_api_key,
+    ensure_path_exists,
+    fetch_api_data,
+)
+
+if TYPE_CHECKING:
+    import aiohttp
+    import pyarrow as pa
+    from aiolimiter import AsyncLimiter
+
+
+def run_person_details(cfg: Dict[str, Any]) -> None:
+    """
+    Public job entrypoint (sync).
+    - Reads config values
+    - Sets up paths
+    - Calls the async worker
+    """
+    api_key = get_api_key()
+
+    api_cfg = cfg["api"]
+    ingest_cfg = cfg["ingestion"]
+    conc_cfg = cfg["concurrency"]
+    paths_cfg = cfg["paths"]
+
+    batch_size = ingest_cfg.get("batch_size", 500)
+    cache_ttl_days = ingest_cfg.get("person_cache_ttl_days", 30)
+
+    data_root = Path(paths_cfg["data_dir"])
+    details_file = data_root / "movie_details" / "movie_details.parquet"
+    people_dir = data_root / "person_details"
+    ensure_path_exists(people_dir)
+
+    # Input: credits embedded in the movie details file
+    if not details_file.exists():
+        raise FileNotFoundError(
+            f"No movie details file found at {details_file}. "
+            f"Run fetch_movie_details.py first."
+        )
+
+    asyncio.run(
+        _fetch_person_details(
+            details_file=details_file,
+            api_key=api_key,
+            api_cfg=api_cfg,
+            conc_cfg=conc_cfg,
+            people_dir=people_dir,
+            batch_size=batch_size,
+            cache_ttl_days=cache_ttl_days,
+        )
+    )
+
+
+async def _fetch_person_details(
+    details_file: Path,
+    api_key: str,
+    api_cfg: Dict[str, Any],
+    conc_cfg: Dict[str, Any],
+    people_dir: Path,
+    batch_size: int = 500,
+    cache_ttl_days: int = 30,
+) -> None:
+    """
+    Fetch person details for every distinct person in the credits data.
+    - Dedupes person IDs across all cast/crew credits
+    - Skips people already in the local cache and still fresh (cache_ttl_days plus a per-person jitter)
+    - Caches 404s with a null payload so deleted people are not re-requested every run
+    - Writes one Parquet file per batch, then compacts the cache into one file
+    """
+    import aiohttp
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    from aiolimiter import AsyncLimiter
+    from tqdm.asyncio import tqdm_asyncio
+
+    base_url = api_cfg["person_url"]  # e.g. https://api.themoviedb.org/3/person/
+
+    params = {"api_key": api_key}
+
+    limiter = AsyncLimiter(conc_cfg["max_rate"], conc_cfg["time_period"])
+    semaphore = asyncio.Semaphore(conc_cfg["semaphore_limit"])
+
+    print("Loading distinct person IDs from credits...")
+    all_person_ids = _load_person_ids(details_file)
+    print(f"Found {len(all_person_ids)} distinct people in {details_file}")
+
+    cache = _load_cache(people_dir)
+    now = datetime.now(timezone.utc)
+    cached_at = dict(
+        zip(cache["person_id"].to_pylist(), cache["ingested_at"].to_pylist())
+    )
+
+    person_ids = [
+        person_id
+        for person_id in all_person_ids
+        if person_id not in cached_at
+        or _is_stale(person_id, cached_at[person_id], now, cache_ttl_days)
+    ]
+
+    print(
+        f"{len(all_person_ids) - len(person_ids)} people cached and fresh "
+        f"(ttl={cache_ttl_days}-{2 * cache_ttl_days - 1} days), {len(person_ids)} to fetch"
+    )
+
+    if person_ids:
+        # One file per run/batch, so an interrupted run still leaves usable cache
+        run_tag = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+        num_people = len(person_ids)
+        num_batches = (num_people + batch_size - 1) // batch_size
+        num_failed = 0
+        num_not_found = 0
+
+        async with aiohttp.ClientSession() as session:
+            for batch_idx, batch_start in enumerate(range(0, num_people, batch_size), start=1):
+                batch_ids = person_ids[batch_start : batch_start + batch_size]
+
+                tasks = []
+                for person_id in batch_ids:
+                    url = f"{base_url}{person_id}"
+                    task = _fetch_with_metadata(
+                        url=url,
+                        session=session,
+                        params=params,
+                        semaphore=semaphore,
+                        limiter=limiter,
+                        person_id=person_id,
+                    )
+                    tasks.append(task)
+
+                batch_results = await tqdm_asyncio.gather(
+                    *tasks,
+                    total=len(tasks),
+                    desc=f"Batch {batch_idx}/{num_batches}",
+                    leave=False,
+                )
+
+                # Failed fetches are left out so they get retried next run;
+                # people TMDB no longer has are kept with a null payload so they follow the TTL
+                rows = [row for row in batch_results if row is not None]
+                num_failed += len(batch_results) - len(rows)
+                num_not_found += sum(1 for row in rows if row["payload_json"] is None)
+
+                if rows:
+                    table = pa.Table.from_pylist(rows, schema=_person_details_schema())
+                    out_path = people_dir / f"person_details_{run_tag}_{batch_idx:05d}.parquet"
+                    pq.write_table(table, out_path, compression="snappy")
+
+                print(f"Batch {batch_idx}/{num_batches} complete ({len(rows)} people)")
+
+        if num_not_found:
+            print(f"{num_not_found} people not found on TMDB, cached as missing until they go stale")
+        if num_failed:
+            print(f"WARNING: {num_failed} people could not be fetched and will be retried next run")
+
+    _compact_cache(people_dir)
+
+
+async def _fetch_with_metadata(
+    url: str,
+    session: aiohttp.ClientSession,
+    params: Dict[str, Any],
+    semaphore: asyncio.Semaphore,
+    limiter: AsyncLimiter,
+    person_id: int,
+) -> Optional[Dict[str, Any]]:
+    """
+    Fetch a single person's details and wrap with metadata.
+    Returns None on a failed fetch, and a row with a null payload on a 404.
+    """
+    data = await fetch_api_data(
+        url=url,
+        session=session,
+        params=params,
+        semaphore=semaphore,
+        limiter=limiter,
+        not_found={},
+    )
+
+    if data is None:
+        return None
+
+    return {
+        "person_id": person_id,
+        "payload_json": data or None,
+        "ingested_at": datetime.now(timezone.utc),
+    }
+
+
+def _is_stale(person_id: int, fetched_at: datetime, now: datetime, ttl_days: int) -> bool:
+    """
+    Whether a cached person is due for a refetch.
+    Each person gets a fixed jitter of person_id % ttl_days extra days, so people
+    fetched in the same run expire spread over ttl_days instead of all at once.
+    """
+    jitter_days = person_id % ttl_days if ttl_days > 0 else 0
+    return fetched_at < now - timedelta(days=ttl_days + jitter_days)
+
+
+def _load_person_ids(details_file: Path) -> List[int]:
+    """
+    Collect distinct person IDs from the cast and crew arrays of every movie.
+    """
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    payloads = (
+        pq.read_table(details_file, columns=["payload_json"])
+        .column("payload_json")
+        .combine_chunks()
+    )
+
+    person_ids = set()
+    for credit_type in ("cast", "crew"):
+        credits = pc.list_flatten(pc.struct_field(payloads, ["credits", credit_type]))
+        person_ids.update(pc.struct_field(credits, "id").drop_null().to_pylist())
+
+    return sorted(person_ids)
+
+
+def _load_cache(people_dir: Path) -> pa.Table:
+    """
+    Load the local person cache, keeping only the latest row per person.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    cache_files = sorted(people_dir.glob("person_details*.parquet"))
+    if not cache_files:
+        return _person_details_schema().empty_table()
+
+    cache = pa.concat_tables([pq.read_table(f) for f in cache_files])
+
+    # Latest ingestion wins for people fetched more than once
+    cache = cache.sort_by([("person_id", "ascending"), ("ingested_at", "descending")])
+    person_ids = cache["person_id"].to_pylist()
+    keep = [i == 0 or person_ids[i] != person_ids[i - 1] for i in range(len(person_ids))]
+
+    return cache.filter(pa.array(keep, type=pa.bool_()))
+
+
+def _compact_cache(people_dir: Path) -> None:
+    """
+    Merge all batch files into a single person_details.parquet.
+    Always leaves that file in place (empty if nothing is cached yet),
+    since the dbt source fails on a folder with no Parquet files.
+    """
+    import pyarrow.parquet as pq
+
+    output_file = people_dir / "person_details.parquet"
+    batch_files = sorted(people_dir.glob("person_details_*.parquet"))
+    if not batch_files and output_file.exists():
+        print(f"Person cache is up to date: {output_file}")
+        return
+
+    cache = _load_cache(people_dir)
+
+    # Write to a temp file first so a failed write never loses the cache
+    tmp_file = people_dir / "person_details.parquet.tmp"
+    pq.write_table(cache, tmp_file, compression="snappy")
+    tmp_file.replace(output_file)
+
+    for batch_file in batch_files:
+        batch_file.unlink()
+
+    print(f"Wrote {cache.num_rows} people to {output_file}")
+
+
+def _person_details_schema() -> pa.Schema:
+    """
+    Explicit schema for /person/{id} payloads so every batch file lines up,
+    even when a whole batch has e.g. no deathday values.
+    """
+    import pyarrow as pa
+
+    payload_type = pa.struct(
+        [
+            ("id", pa.int64()),
+            ("imdb_id", pa.string()),
+            ("name", pa.string()),
+            ("also_known_as", pa.list_(pa.string())),
+            ("gender", pa.int64()),
+            ("known_for_department", pa.string()),
+            ("place_of_birth", pa.string()),
+            ("biography", pa.string()),
+            ("birthday", pa.string()),
+            ("deathday", pa.string()),
+            ("popularity", pa.float64()),
+            ("adult", pa.bool_()),
+            ("profile_path", pa.string()),
+            ("homepage", pa.string()),
+        ]
+    )
+
+    return pa.schema(
+        [
+            ("person_id", pa.int64()),
+            ("payload_json", payload_type),
+            ("ingested_at", pa.timestamp("us", tz="UTC")),
+        ]
+    )
+
+
+def _parse_args() -> argparse.Namespace:
+    """
+    CLI parser for this job.
+    """
+    parser = argparse.ArgumentParser(
+        description="Fetch TMDB person details for all people in the credits data."
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        help="Override batch size for fetching (default: 500)",
+    )
+    parser.add_argument(
+        "--cache-ttl-days",
+        type=int,
+        help="Override the minimum days a cached person stays fresh (default: 30)",
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    cfg = load_config()
+    args = _parse_args()
+
+    if args.batch_size is not None:
+        cfg["ingestion"]["batch_size"] = args.batch_size
+    if args.cache_ttl_days is not None:
+        cfg["ingestion"]["person_cache_ttl_days"] = args.cache_ttl_days
+
+    run_person_details(cfg)
@@ -5,9 +5,6 @@ import csv
 from pathlib import Path
 from typing import Dict, Any
 
-import pandas as pd
-import requests
-
 from tmdb_ingestion.utils import (
     load_config,
     get_api_key,
@@ -24,6 +21,9 @@ def run_update_seeds(cfg: Dict[str, Any]) -> None:
     - Fetches genres, countries, and languages from TMDB
     - Writes them to CSV files in the seeds directory
     """
+    import pandas as pd
+    import requests
+
     api_key = get_api_key()
 
     paths_cfg = cfg["paths"]
@@ -1,16 +1,16 @@
 import os
-from dotenv import load_dotenv
 from pathlib import Path
 import json
 
-import aiohttp
-import asyncio
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
-import yaml
-
-load_dotenv()
+_dotenv_loaded = False
 
 def get_api_key():
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _dotenv_loaded = True
+
     try:
         api_key = os.getenv("TMDB_API_KEY")
         return api_key
@@ -43,6 +43,8 @@ def load_config(config_file="config.yml"):
     if not config_path.exists():
         raise FileNotFoundError(f"Config file not found at {config_path}")
 
+    import yaml
+
     with open(config_path, "r") as f:
         return yaml.safe_load(f)
     
@@ -51,7 +53,7 @@ def ensure_path_exists(path: str | Path):
     (path.parent if path.suffix else path).mkdir(parents=True, exist_ok=True)
 
 def notify_before_retry(retry_state):
-    print(f"Retrying movie {retry_state.args[1]}: attempt {retry_state.attempt_number}")
+    print(f"Retrying {retry_state.args[0]}: attempt {retry_state.attempt_number}")
 
 
 def serialize_json(data):
@@ -60,29 +62,54 @@ def serialize_json(data):
         for k, v in data.items()
     }
 
-@retry(
-    wait=wait_exponential(multiplier=1, min=1, max=10),
-    stop=stop_after_attempt(5),
-    retry=retry_if_exception_type((aiohttp.ClientError, asyncio.TimeoutError)),
-    before_sleep = notify_before_retry
-)
-async def fetch_api_data(url, session, params, semaphore, limiter, serialize=False):
-    timeout = aiohttp.ClientTimeout(total=30)  # 30 second total timeout
-    
-    async with semaphore:
-        async with limiter:
-            async with session.get(url, params=params, timeout=timeout) as response:
-                try:
-                    response.raise_for_status()
+def _build_fetch_api_data():
+    """
+    Build the retrying fetch coroutine on first use, so aiohttp/tenacity
+    are only imported by jobs that actually hit the API.
+    """
+    import asyncio
+
+    import aiohttp
+    from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+
+    @retry(
+        wait=wait_exponential(multiplier=1, min=1, max=10),
+        stop=stop_after_attempt(5),
+        retry=retry_if_exception_type((aiohttp.ClientError, asyncio.TimeoutError)),
+        before_sleep = notify_before_retry
+    )
+    async def _fetch_api_data(url, session, params, semaphore, limiter, serialize=False, not_found=None):
+        timeout = aiohttp.ClientTimeout(total=30)  # 30 second total timeout
+
+        async with semaphore:
+            async with limiter:
+                async with session.get(url, params=params, timeout=timeout) as response:
                     try:
-                        data = await response.json()
-                        if serialize:
-                            return serialize_json(data)
-                        else:
-                            return data
-                    except Exception as err:
-                        print(f"Could not fetch data for {url} with params {params}: {err}")
+                        response.raise_for_status()
+                        try:
+                            data = await response.json()
+                            if serialize:
+                                return serialize_json(data)
+                            else:
+                                return data
+                        except Exception as err:
+                            print(f"Could not fetch data for {url} with params {params}: {err}")
+                            return None
+                    except aiohttp.ClientResponseError as e:
+                        # Callers can ask for a marker on 404 to tell deleted records apart from failures
+                        if e.status == 404 and not_found is not None:
+                            return not_found
+                        print(f"Script failed for {url} with params {params}")
                         return None
-                except aiohttp.ClientResponseError as e:
-                    print(f"Script failed for {url} with params {params}")
-                    return None 
\ No newline at end of file
+
+    return _fetch_api_data
+
+
+_fetch_api_data = None
+
+async def fetch_api_data(url, session, params, semaphore, limiter, serialize=False, not_found=None):
+    global _fetch_api_data
+    if _fetch_api_data is None:
+        _fetch_api_data = _build_fetch_api_data()
+
+    return await _fetch_api_data(url, session, params, semaphore, limiter, serialize, not_found)